@@ -5,28 +5,79 @@ Handles loading and saving of tenants.json and plugins.json files
 
 import json
 import os
-from typing import Dict, List, Tuple, Optional
+import re
+import shutil
+from typing import Collection, Dict, List, Tuple, Optional
+
+# fastjsonschema is optional: compiled fast-accept check for tenants when installed
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 
 # File paths - configurable at the top
 TENANTS_FILE = "tenants.json"
 PLUGINS_FILE = "plugins.json"
 
+# Precompiled patterns for the common (valid) case; detailed checks only run on mismatch
+_PKG_RE = re.compile(r'[a-z][a-z0-9_]*(?:\.[a-z][a-z0-9_]*)+')
+_INIT_RE = re.compile(r'[A-Za-z][A-Za-z0-9_]*')
+_DASHES = re.compile(r'-+')
+_NORM_TABLE = str.maketrans({' ': '-', '_': '-'})
+
+# Schema for a well-formed tenant. It is deliberately stricter than validate_tenant
+# (no surrounding whitespace in companyInitial/packageName/logoPath, companyInitial must be present), so anything it accepts
+# is valid; anything it rejects falls back to the Python checks for a detailed error.
+# fastjsonschema matches patterns with re.search, so they end in \Z rather than $
+# ($ would also accept a trailing newline).
+TENANT_SCHEMA = {
+    "type": "object",
+    "required": ["id", "companyInitial", "appName", "packageName", "enabledFeatures"],
+    "properties": {
+        "id": {"type": "string", "minLength": 1},
+        "companyInitial": {"type": "string", "pattern": r"^[A-Za-z][A-Za-z0-9_]{0,19}\Z"},
+        "appName": {"type": "string", "pattern": r"\S"},
+        "packageName": {
+            "type": "string",
+            "maxLength": 100,
+            "pattern": r"^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)+\Z",
+        },
+        "logoPath": {
+            "type": "string",
+            "pattern": r"^(|https?://\S{0,492}|[A-Za-z0-9_][A-Za-z0-9_./-]{0,199})\Z",
+        },
+        "enabledFeatures": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+_TENANT_VALIDATOR = fastjsonschema.compile(TENANT_SCHEMA) if fastjsonschema is not None else None
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes."""
+    return json.loads(data)
+
+
+def _read_json(path: str):
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _dumps(data) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes."""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 def normalize_tenant_id(tenant_id: str) -> str:
     """Normalize tenant ID to lowercase kebab-case format."""
     if not tenant_id:
         return tenant_id
-    # Convert to lowercase
-    normalized = tenant_id.lower()
-    # Replace spaces and underscores with dashes
-    normalized = normalized.replace(' ', '-').replace('_', '-')
-    # Remove multiple consecutive dashes
-    while '--' in normalized:
-        normalized = normalized.replace('--', '-')
-    # Remove leading/trailing dashes
-    normalized = normalized.strip('-')
-    return normalized
+    # Lowercase, then replace spaces and underscores with dashes in one pass
+    normalized = tenant_id.lower().translate(_NORM_TABLE)
+    # Collapse consecutive dashes and remove leading/trailing dashes
+    return _DASHES.sub('-', normalized).strip('-')
 
 
 def load_tenants(file_path: Optional[str] = None) -> Tuple[Dict, Optional[str]]:
@@ -44,23 +95,22 @@ def load_tenants(file_path: Optional[str] = None) -> Tuple[Dict, Optional[str]]:
         return {}, f"File not found: {path}"
     
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                return {}, f"Invalid format: {path} must contain a JSON object"
-            
-            # Normalize tenant IDs (keys) and update id field in each tenant
-            normalized_data = {}
-            for key, tenant in data.items():
-                # Normalize the key
-                normalized_key = normalize_tenant_id(key)
-                # Update tenant's id field to match normalized key
-                if isinstance(tenant, dict):
-                    tenant['id'] = normalized_key
-                # Use normalized key
-                normalized_data[normalized_key] = tenant
-            
-            return normalized_data, None
+        data = _read_json(path)
+        if not isinstance(data, dict):
+            return {}, f"Invalid format: {path} must contain a JSON object"
+        
+        # Normalize tenant IDs (keys) and update id field in each tenant
+        normalized_data = {}
+        for key, tenant in data.items():
+            # Normalize the key
+            normalized_key = normalize_tenant_id(key)
+            # Update tenant's id field to match normalized key
+            if isinstance(tenant, dict):
+                tenant['id'] = normalized_key
+            # Use normalized key
+            normalized_data[normalized_key] = tenant
+        
+        return normalized_data, None
     except json.JSONDecodeError as e:
         return {}, f"Invalid JSON in {path}: {str(e)}"
     except Exception as e:
@@ -81,11 +131,10 @@ def load_plugins(file_path: Optional[str] = None) -> Tuple[Dict, Optional[str]]:
         return {}, f"File not found: {path}"
     
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                return {}, f"Invalid format: {path} must contain a JSON object"
-            return data, None
+        data = _read_json(path)
+        if not isinstance(data, dict):
+            return {}, f"Invalid format: {path} must contain a JSON object"
+        return data, None
     except json.JSONDecodeError as e:
         return {}, f"Invalid JSON in {path}: {str(e)}"
     except Exception as e:
@@ -114,6 +163,11 @@ def validate_package_name(package_name: str) -> Tuple[bool, Optional[str]]:
     
     trimmed = package_name.strip()
     
+    # Common case first: one regex match accepts a valid name; the checks below
+    # only run to build a detailed error message
+    if len(trimmed) <= 100 and _PKG_RE.fullmatch(trimmed):
+        return True, None
+    
     if len(trimmed) == 0:
         return False, "Package name cannot be empty. Expected format: com.company.app (reverse domain notation)"
     
@@ -223,6 +277,9 @@ def validate_company_initial(company_initial: str) -> Tuple[bool, Optional[str]]
     if len(trimmed) > 20:
         return False, f"❌ Company initial is too long ({len(trimmed)} characters). Maximum length is 20 characters. Expected format: Uppercase alphanumeric string (e.g., 'TKIFTP', 'MB', 'P2L'). Got: '{trimmed}'"
     
+    if _INIT_RE.fullmatch(trimmed):
+        return True, None
+    
     # Must contain only alphanumeric characters and underscores
     if not all(c.isalnum() or c == '_' for c in trimmed):
         return False, f"❌ Company initial contains invalid characters. Only uppercase letters, numbers, and underscores are allowed. Expected format: Uppercase alphanumeric string (e.g., 'TKIFTP', 'MB', 'P2L'). Got: '{trimmed}'"
@@ -234,13 +291,24 @@ def validate_company_initial(company_initial: str) -> Tuple[bool, Optional[str]]
     return True, None
 
 
-def validate_tenant(tenant: Dict, tenant_id: str, available_plugins: Dict) -> Tuple[bool, Optional[str]]:
+def validate_tenant(tenant: Dict, tenant_id: str, available_plugins: Collection[str]) -> Tuple[bool, Optional[str]]:
     """
     Validate a tenant configuration.
+    available_plugins is the plugins dict or any collection of plugin IDs.
     
     Returns:
         Tuple of (is_valid, error_message)
     """
+    # Fast path: compiled schema check, then the cross-field checks it cannot express
+    if _TENANT_VALIDATOR is not None:
+        try:
+            _TENANT_VALIDATOR(tenant)
+        except fastjsonschema.JsonSchemaException:
+            pass
+        else:
+            if tenant['id'] == tenant_id and all(f in available_plugins for f in tenant['enabledFeatures']):
+                return True, None
+    
     # Required fields
     if 'id' not in tenant or not tenant['id']:
         return False, "Tenant ID is required"
@@ -258,7 +326,6 @@ def validate_tenant(tenant: Dict, tenant_id: str, available_plugins: Dict) -> Tu
     if not company_initial:
         # Auto-generate from tenant_id if not provided (backward compatibility)
         # But still validate the format
-        import re
         # Normalize tenant_id: remove dashes and convert to uppercase
         auto_initial = tenant_id.replace('-', '').replace('_', '').upper()
         is_valid, error = validate_company_initial(auto_initial)
@@ -312,12 +379,17 @@ def validate_all_tenants(tenants: Dict, plugins: Dict) -> Tuple[bool, Optional[s
     if not tenants:
         return False, "No tenants found"
     
-    for tenant_id, tenant in tenants.items():
-        is_valid, error = validate_tenant(tenant, tenant_id, plugins)
-        if not is_valid:
-            return False, error
-    
-    return True, None
+    plugin_ids = frozenset(plugins) if plugins else frozenset()
+    results = (validate_tenant(tenant, tenant_id, plugin_ids) for tenant_id, tenant in tenants.items())
+    return next((result for result in results if not result[0]), (True, None))
+
+
+def _remove_quietly(path: str) -> None:
+    """Remove a leftover file, ignoring errors (e.g. it was never created)."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 
 def save_tenants(tenants: Dict, plugins: Dict, file_path: Optional[str] = None) -> Tuple[bool, Optional[str]]:
@@ -330,26 +402,46 @@ def save_tenants(tenants: Dict, plugins: Dict, file_path: Optional[str] = None)
     """
     path = file_path or TENANTS_FILE
     
-    # Normalize tenant IDs before validation
-    normalized_tenants = {}
-    for key, tenant in tenants.items():
-        normalized_key = normalize_tenant_id(key)
-        if isinstance(tenant, dict):
-            tenant['id'] = normalized_key
-        normalized_tenants[normalized_key] = tenant
+    # Normalize tenant IDs before validation. Keys are usually already normalized
+    # (load_tenants normalizes them), in which case the dict is used as-is.
+    if all(normalize_tenant_id(key) == key for key in tenants):
+        normalized_tenants = tenants
+    else:
+        normalized_tenants = {normalize_tenant_id(key): tenant for key, tenant in tenants.items()}
     
-    # Validate before saving
-    is_valid, error = validate_all_tenants(normalized_tenants, plugins)
-    if not is_valid:
-        return False, error
+    if not normalized_tenants:
+        return False, "No tenants found"
+    
+    # Sync id fields and validate before saving, in a single pass
+    plugin_ids = frozenset(plugins) if plugins else frozenset()
+    for tenant_id, tenant in normalized_tenants.items():
+        if isinstance(tenant, dict):
+            tenant['id'] = tenant_id
+        is_valid, error = validate_tenant(tenant, tenant_id, plugin_ids)
+        if not is_valid:
+            return False, error
     
+    # Write to a temp file in one call, then atomically replace the target so a
+    # crash mid-write never leaves a truncated tenants.json behind. A symlinked
+    # path is resolved so the link itself is kept and its target is replaced.
+    target_path = os.path.realpath(path)
+    tmp_path = target_path + '.tmp'
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(normalized_tenants, f, indent=2, ensure_ascii=False)
+        payload = _dumps(normalized_tenants)
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(target_path):
+            # Keep the existing file's permissions
+            shutil.copymode(target_path, tmp_path)
+        os.replace(tmp_path, target_path)
         return True, None
     except PermissionError:
+        _remove_quietly(tmp_path)
         return False, f"Permission denied: Cannot write to {path}"
     except Exception as e:
+        _remove_quietly(tmp_path)
         return False, f"Error writing to {path}: {str(e)}"
 
 
@@ -17,23 +17,27 @@ File Requirements:
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import os
+import queue
 import sys
-from typing import Dict, Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 # Import local modules
 from config_io import (
     normalize_tenant_id,
     load_tenants, load_plugins, save_tenants,
-    validate_tenant, validate_company_initial, validate_package_name, validate_logo_path
+    validate_tenant, validate_all_tenants, validate_company_initial, validate_package_name, validate_logo_path
 )
 from repo_generator import normalize_company_initial, to_company_id
 from ui_components import TenantDetailFrame, PluginMatrixFrame
-from repo_generator import generate_repo, list_generated_apps
+from repo_generator import generate_repo, list_generated_apps, get_repo_root
 
 
 class ClosepayManagerApp(tk.Tk):
     """Main application window."""
     
+    LOAD_POLL_MS = 20
+    
     def __init__(self):
         super().__init__()
         
@@ -51,34 +55,105 @@ class ClosepayManagerApp(tk.Tk):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         os.chdir(script_dir)
         
-        # Load data
-        self._load_data()
+        # Load plugins (needed to build the plugin matrix)
+        self._load_plugins()
         
         # Create UI
         self._create_widgets()
         
+        # Load and validate tenants in the background so the window paints immediately
+        self._loading = False
+        self._load_results = queue.Queue()
+        self._start_tenant_load()
+        
         # Bind window close event
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
     
-    def _load_data(self):
-        """Load tenants and plugins from JSON files."""
-        # Load plugins first (needed for validation)
+    def _load_plugins(self):
+        """Load plugins from JSON file."""
         plugins, error = load_plugins()
         if error:
             messagebox.showerror("Error Loading Plugins", error)
             sys.exit(1)
         self.plugins = plugins
+    
+    def _start_tenant_load(self, done_status: Optional[str] = None):
+        """Load tenants on a worker thread; results are applied on the Tk thread."""
+        self._set_loading(True)
+        self.status_var.set("Loading tenants...")
+        threading.Thread(target=self._load_tenants_worker, args=(self.plugins,), daemon=True).start()
+        self.after(self.LOAD_POLL_MS, self._poll_tenant_load, done_status)
+    
+    def _set_loading(self, loading: bool):
+        """
+        Toggle the loading state. Actions and tenant selection are disabled meanwhile,
+        since they would work on (or save) a tenants dict about to be replaced.
+        """
+        self._loading = loading
+        state = 'disabled' if loading else 'normal'
+        for button in self.action_buttons:
+            button.config(state=state)
+        self.tenant_listbox.config(state=state)
+    
+    def _load_tenants_worker(self, plugins: Dict):
+        """Worker thread body: always posts a result so the poller never waits forever."""
+        try:
+            result = self._read_tenants(plugins)
+        except Exception as e:
+            result = ({}, f"Error loading tenants: {str(e)}", None, None)
+        self._load_results.put(result)
+    
+    def _poll_tenant_load(self, done_status: Optional[str]):
+        """Check for finished background load (Tk calls must stay on the main thread)."""
+        try:
+            result = self._load_results.get_nowait()
+        except queue.Empty:
+            self.after(self.LOAD_POLL_MS, self._poll_tenant_load, done_status)
+            return
+        self._apply_loaded(result, done_status)
+    
+    def _apply_loaded(self, result: Tuple, done_status: Optional[str]):
+        """Install loaded tenants and report any load/migration/validation problems."""
+        tenants, load_error, migration_error, validation_error = result
+        self._set_loading(False)
         
+        if load_error:
+            messagebox.showerror("Error Loading Tenants", load_error)
+            sys.exit(1)
+        self.tenants = tenants
+        
+        if migration_error:
+            messagebox.showwarning("Migration Warning", 
+                                 f"Tenants were migrated but could not save:\n{migration_error}")
+        
+        if validation_error:
+            messagebox.showwarning("Validation Warning", 
+                                 f"Some tenants have validation errors:\n{validation_error}\n\n"
+                                 "You can still edit and save, but please fix errors.")
+        
+        self._refresh_tenant_list()
+        self.unsaved_changes = False
+        if done_status:
+            self.status_var.set(done_status)
+        elif not self.tenants:
+            self.status_var.set("Ready")
+    
+    @staticmethod
+    def _read_tenants(plugins: Dict) -> Tuple[Dict, Optional[str], Optional[str], Optional[str]]:
+        """
+        Load, migrate and validate tenants. Runs on a worker thread, so it must not touch Tk.
+        
+        Returns:
+            Tuple of (tenants, load_error, migration_error, validation_error)
+        """
         # Load tenants
         tenants, error = load_tenants()
         if error:
-            messagebox.showerror("Error Loading Tenants", error)
-            sys.exit(1)
-        self.tenants = tenants
+            return {}, error, None, None
         
         # Migrate old structure to new structure (backward compatibility)
         migrated = False
-        for tenant_id, tenant in self.tenants.items():
+        for tenant_id, tenant in tenants.items():
             # Check if migration needed (has 'role' or 'theme' but missing new fields)
             needs_migration = False
             
@@ -100,7 +175,6 @@ class ClosepayManagerApp(tk.Tk):
             # Add default packageName if missing
             if 'packageName' not in tenant:
                 # Auto-generate from tenant_id as fallback
-                from repo_generator import to_company_id
                 company_id = to_company_id(tenant.get('companyInitial', tenant_id))
                 tenant['packageName'] = f"com.closepay.{company_id.replace('-', '.')}"
                 needs_migration = True
@@ -114,19 +188,15 @@ class ClosepayManagerApp(tk.Tk):
                 migrated = True
         
         # Save if migration occurred
+        migration_error = None
         if migrated:
-            success, error = save_tenants(self.tenants, self.plugins)
+            success, error = save_tenants(tenants, plugins)
             if not success:
-                messagebox.showwarning("Migration Warning", 
-                                     f"Tenants were migrated but could not save:\n{error}")
+                migration_error = error
         
         # Validate tenants
-        from config_io import validate_all_tenants
-        is_valid, error = validate_all_tenants(self.tenants, self.plugins)
-        if not is_valid:
-            messagebox.showwarning("Validation Warning", 
-                                 f"Some tenants have validation errors:\n{error}\n\n"
-                                 "You can still edit and save, but please fix errors.")
+        is_valid, validation_error = validate_all_tenants(tenants, plugins)
+        return tenants, None, migration_error, None if is_valid else validation_error
     
     def _create_widgets(self):
         """Create all UI widgets."""
@@ -184,21 +254,18 @@ class ClosepayManagerApp(tk.Tk):
         button_frame = ttk.Frame(main_container)
         button_frame.grid(row=1, column=1, sticky="ew", pady=(10, 0))
         
-        ttk.Button(button_frame, text="Save", command=self._save_changes).grid(
-            row=0, column=0, padx=(0, 5)
-        )
-        ttk.Button(button_frame, text="Reload", command=self._reload_data).grid(
-            row=0, column=1, padx=(0, 5)
-        )
-        ttk.Button(button_frame, text="Add Tenant", command=self._add_tenant).grid(
-            row=0, column=2, padx=(0, 5)
-        )
-        ttk.Button(button_frame, text="Delete Tenant", command=self._delete_tenant).grid(
-            row=0, column=3, padx=(0, 5)
-        )
-        ttk.Button(button_frame, text="Generate Repo", command=self._generate_repo).grid(
-            row=0, column=4, padx=(0, 5)
-        )
+        # Kept so they can be disabled while tenants are loading
+        self.action_buttons = []
+        for column, (text, command) in enumerate([
+            ("Save", self._save_changes),
+            ("Reload", self._reload_data),
+            ("Add Tenant", self._add_tenant),
+            ("Delete Tenant", self._delete_tenant),
+            ("Generate Repo", self._generate_repo),
+        ]):
+            button = ttk.Button(button_frame, text=text, command=command)
+            button.grid(row=0, column=column, padx=(0, 5))
+            self.action_buttons.append(button)
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -206,8 +273,6 @@ class ClosepayManagerApp(tk.Tk):
                                 relief=tk.SUNKEN, anchor="w")
         status_label.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(10, 0))
         
-        # Populate tenant list (after all widgets are created)
-        self._refresh_tenant_list()
     
     def _refresh_tenant_list(self):
         """Refresh the tenant listbox."""
@@ -256,6 +321,9 @@ class ClosepayManagerApp(tk.Tk):
         if not self.current_tenant_id:
             return
         
+        # Apply any debounced field change now so it cannot fire after the save
+        self.tenant_detail.flush_pending_change()
+        
         # Get data from UI
         tenant_data = self.tenant_detail.get_tenant_data()
         enabled_features = self.plugin_matrix.get_enabled_features()
@@ -290,6 +358,11 @@ class ClosepayManagerApp(tk.Tk):
     
     def _reload_data(self):
         """Reload data from disk."""
+        if self._loading:
+            return
+        
+        # Apply any debounced field change so it counts as unsaved
+        self.tenant_detail.flush_pending_change()
         if self.unsaved_changes:
             response = messagebox.askyesno(
                 "Unsaved Changes",
@@ -300,10 +373,8 @@ class ClosepayManagerApp(tk.Tk):
                 return
         
         # Reload from disk
-        self._load_data()
-        self._refresh_tenant_list()
-        self.unsaved_changes = False
-        self.status_var.set("Data reloaded from disk")
+        self._load_plugins()
+        self._start_tenant_load("Data reloaded from disk")
     
     def _add_tenant(self):
         """Add a new tenant."""
@@ -327,7 +398,6 @@ class ClosepayManagerApp(tk.Tk):
             return
         
         # Auto-generate tenant_id from companyInitial (kebab-case)
-        from repo_generator import to_company_id
         tenant_id = to_company_id(company_initial)
         
         if tenant_id in self.tenants:
@@ -490,7 +560,6 @@ class ClosepayManagerApp(tk.Tk):
             output_path = output_dir
         
         # Check if repo already exists
-        from repo_generator import get_repo_root
         repo_root = get_repo_root()
         if output_path:
             target_path = os.path.join(output_path, folder_name)
@@ -541,6 +610,8 @@ class ClosepayManagerApp(tk.Tk):
     
     def _on_closing(self):
         """Handle window close event."""
+        # Apply any debounced field change so it counts as unsaved
+        self.tenant_detail.flush_pending_change()
         if self.unsaved_changes:
             response = messagebox.askyesno(
                 "Unsaved Changes",
@@ -3,52 +3,75 @@ UI Components Module
 Reusable Tkinter UI component classes
 """
 
+import json
+import math
 import tkinter as tk
-from tkinter import ttk
-from typing import Dict, Callable, Optional
+import tkinter.font as tkfont
+from tkinter import ttk, messagebox
+from typing import Dict, Callable, List, Optional, Tuple, Union
+
+# Home tab fields and their types (mirrors HomeTabConfig in
+# packages/core/config/types/AppConfig.ts). Both the msgspec HomeTab struct and
+# the stdlib fallback in TenantDetailFrame._parse_tabs enforce these same rules.
+HOME_TAB_FIELDS = ('id', 'label', 'component', 'visible', 'order')
+
+# msgspec is optional: single-pass parse + validation of home tabs when installed
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if msgspec is not None:
+    class HomeTab(msgspec.Struct, forbid_unknown_fields=True):
+        """Home tab entry; unknown keys are rejected rather than silently dropped."""
+        id: str
+        label: str
+        component: Union[str, msgspec.UnsetType] = msgspec.UNSET
+        visible: Union[bool, msgspec.UnsetType] = msgspec.UNSET
+        # TS `number`: ints stay ints, floats are allowed
+        order: Union[int, float, msgspec.UnsetType] = msgspec.UNSET
+    
+    _TABS_DECODER = msgspec.json.Decoder(List[HomeTab])
+else:
+    _TABS_DECODER = None
 
 
 class TenantDetailFrame(ttk.Frame):
     """Frame containing editable fields for tenant properties."""
     
+    CHANGE_DEBOUNCE_MS = 80
+    
     def __init__(self, parent, on_change: Optional[Callable] = None):
         super().__init__(parent, padding="10")
         self.on_change = on_change
         self.tenant_id = None
         self._home_tabs = []  # Initialize home tabs
+        self._dirty_after = None  # Pending debounced on_change callback
+        self._tabs_dialog = None  # Home tabs dialog, built on first use
+        self._tabs_text = None
         
         # Create widgets
         self._create_widgets()
     
     def _create_widgets(self):
         """Create all input widgets."""
-        # Company Initial (PRIMARY)
-        ttk.Label(self, text="Company Initial:").grid(row=0, column=0, sticky="w", pady=2)
-        self.company_initial_var = tk.StringVar()
-        self.company_initial_entry = ttk.Entry(self, textvariable=self.company_initial_var, width=30)
-        self.company_initial_entry.grid(row=0, column=1, sticky="ew", padx=(10, 0), pady=2)
-        self.company_initial_var.trace('w', self._on_field_change)
-        
-        # App Name
-        ttk.Label(self, text="App Name:").grid(row=1, column=0, sticky="w", pady=2)
-        self.app_name_var = tk.StringVar()
-        self.app_name_entry = ttk.Entry(self, textvariable=self.app_name_var, width=30)
-        self.app_name_entry.grid(row=1, column=1, sticky="ew", padx=(10, 0), pady=2)
-        self.app_name_var.trace('w', self._on_field_change)
-        
-        # Package Name
-        ttk.Label(self, text="Package Name:").grid(row=2, column=0, sticky="w", pady=2)
-        self.package_name_var = tk.StringVar()
-        self.package_name_entry = ttk.Entry(self, textvariable=self.package_name_var, width=30)
-        self.package_name_entry.grid(row=2, column=1, sticky="ew", padx=(10, 0), pady=2)
-        self.package_name_var.trace('w', self._on_field_change)
-        
-        # Logo Path
-        ttk.Label(self, text="Logo Path:").grid(row=3, column=0, sticky="w", pady=2)
-        self.logo_path_var = tk.StringVar()
-        self.logo_path_entry = ttk.Entry(self, textvariable=self.logo_path_var, width=30)
-        self.logo_path_entry.grid(row=3, column=1, sticky="ew", padx=(10, 0), pady=2)
-        self.logo_path_var.trace('w', self._on_field_change)
+        # Text fields: (label, variable attribute, entry attribute); Company Initial is PRIMARY
+        entry_fields = [
+            ("Company Initial:", 'company_initial_var', 'company_initial_entry'),
+            ("App Name:", 'app_name_var', 'app_name_entry'),
+            ("Package Name:", 'package_name_var', 'package_name_entry'),
+            ("Logo Path:", 'logo_path_var', 'logo_path_entry'),
+        ]
+        self._field_vars = []
+        for row, (label_text, var_name, entry_name) in enumerate(entry_fields):
+            ttk.Label(self, text=label_text).grid(row=row, column=0, sticky="w", pady=2)
+            var = tk.StringVar()
+            entry = ttk.Entry(self, textvariable=var, width=30)
+            entry.grid(row=row, column=1, sticky="ew", padx=(10, 0), pady=2)
+            setattr(self, var_name, var)
+            setattr(self, entry_name, entry)
+            self._field_vars.append(var)
         
         # Home Variant
         ttk.Label(self, text="Home Variant:").grid(row=4, column=0, sticky="w", pady=2)
@@ -67,12 +90,37 @@ class TenantDetailFrame(ttk.Frame):
         
         # Configure grid weights
         self.columnconfigure(1, weight=1)
+        
+        # Install write traces once all widgets exist, sharing one registered Tcl command
+        # (Variable.trace_add would register a separate wrapper per variable)
+        change_cmd = self.register(self._on_field_change)
+        for var in self._field_vars:
+            self.tk.call('trace', 'add', 'variable', str(var), 'write', change_cmd)
     
     def _on_field_change(self, *args):
-        """Callback when any field changes."""
+        """Callback when any field changes; coalesces bursts (e.g. typing) into one on_change."""
+        if self._dirty_after:
+            self.after_cancel(self._dirty_after)
+        self._dirty_after = self.after(self.CHANGE_DEBOUNCE_MS, self._fire_change)
+    
+    def _fire_change(self):
+        """Deliver the debounced change notification."""
+        self._dirty_after = None
         if self.on_change:
             self.on_change()
     
+    def flush_pending_change(self):
+        """Deliver a pending change notification now (call before saving the fields)."""
+        if self._dirty_after:
+            self.after_cancel(self._dirty_after)
+            self._fire_change()
+    
+    def _cancel_pending_change(self):
+        """Drop a pending change notification caused by programmatic field updates."""
+        if self._dirty_after:
+            self.after_cancel(self._dirty_after)
+            self._dirty_after = None
+    
     def _on_home_variant_change(self, *args):
         """Handle home variant change."""
         variant = self.home_variant_var.get()
@@ -85,64 +133,108 @@ class TenantDetailFrame(ttk.Frame):
     
     def _manage_home_tabs(self):
         """Open dialog to manage home tabs."""
-        from tkinter import simpledialog, messagebox
-        
-        # Get current tabs
-        current_tabs = getattr(self, '_home_tabs', [])
+        # The dialog is built once and then only shown/hidden
+        if self._tabs_dialog is None:
+            self._build_tabs_dialog()
         
+        self._tabs_text.delete('1.0', tk.END)
+        self._tabs_text.insert('1.0', json.dumps(self._home_tabs, indent=2))
+        self._tabs_dialog.deiconify()
+        self._tabs_dialog.grab_set()
+    
+    def _build_tabs_dialog(self):
+        """Create the (initially hidden) home tabs dialog."""
         # Simple dialog to edit tabs as JSON
         dialog = tk.Toplevel(self)
+        dialog.withdraw()
         dialog.title("Manage Home Tabs")
         dialog.geometry("500x400")
         dialog.transient(self)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._close_tabs_dialog)
         
         ttk.Label(dialog, text="Home Tabs (JSON format):").pack(pady=5)
         
-        import json
         text_widget = tk.Text(dialog, height=15, width=60)
         text_widget.pack(padx=10, pady=5, fill='both', expand=True)
-        text_widget.insert('1.0', json.dumps(current_tabs, indent=2))
-        
-        def save_tabs():
-            try:
-                content = text_widget.get('1.0', tk.END).strip()
-                if content:
-                    tabs = json.loads(content)
-                    # Validate tabs structure
-                    if not isinstance(tabs, list):
-                        messagebox.showerror("Error", "Tabs must be an array")
-                        return
-                    for tab in tabs:
-                        if not isinstance(tab, dict) or 'id' not in tab or 'label' not in tab:
-                            messagebox.showerror("Error", "Each tab must have 'id' and 'label'")
-                            return
-                    self._home_tabs = tabs
-                    dialog.destroy()
-                    self._on_field_change()
-                else:
-                    self._home_tabs = []
-                    dialog.destroy()
-                    self._on_field_change()
-            except json.JSONDecodeError as e:
-                messagebox.showerror("Error", f"Invalid JSON: {str(e)}")
         
         button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=5)
-        ttk.Button(button_frame, text="Save", command=save_tabs).pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Save", command=self._save_tabs).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self._close_tabs_dialog).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Insert Example", command=self._insert_example_tabs).pack(side='left', padx=5)
         
-        # Example button
-        def insert_example():
-            example = [
-                {"id": "services", "label": "Services", "visible": True, "order": 1},
-                {"id": "promotions", "label": "Promotions", "visible": True, "order": 2},
-                {"id": "profile", "label": "Profile", "visible": True, "order": 3}
-            ]
-            text_widget.delete('1.0', tk.END)
-            text_widget.insert('1.0', json.dumps(example, indent=2))
+        self._tabs_dialog = dialog
+        self._tabs_text = text_widget
+    
+    def _close_tabs_dialog(self):
+        """Hide the home tabs dialog so it can be reused."""
+        self._tabs_dialog.grab_release()
+        self._tabs_dialog.withdraw()
+    
+    def _save_tabs(self):
+        """Validate the dialog's JSON and store it as home tabs."""
+        content = self._tabs_text.get('1.0', tk.END).strip()
+        tabs, error = self._parse_tabs(content) if content else ([], None)
+        if error:
+            messagebox.showerror("Error", error)
+            return
+        self._home_tabs = tabs
+        self._close_tabs_dialog()
+        self._on_field_change()
+    
+    @staticmethod
+    def _parse_tabs(content: str) -> Tuple[Optional[List[Dict]], Optional[str]]:
+        """
+        Parse and validate home tabs JSON.
         
-        ttk.Button(button_frame, text="Insert Example", command=insert_example).pack(side='left', padx=5)
+        Returns:
+            Tuple of (tabs, error_message)
+        """
+        if _TABS_DECODER is not None:
+            # Parse and validate in one pass; unset optional fields are omitted,
+            # so tabs round-trip as written
+            try:
+                return msgspec.to_builtins(_TABS_DECODER.decode(content.encode('utf-8'))), None
+            except msgspec.ValidationError as e:
+                return None, f"Invalid tabs: {str(e)}"
+            except msgspec.DecodeError as e:
+                return None, f"Invalid JSON: {str(e)}"
+        
+        try:
+            tabs = json.loads(content)
+        except json.JSONDecodeError as e:
+            return None, f"Invalid JSON: {str(e)}"
+        # Validate tabs structure (same rules as HomeTab)
+        if not isinstance(tabs, list):
+            return None, "Tabs must be an array"
+        for i, tab in enumerate(tabs):
+            if not isinstance(tab, dict) or 'id' not in tab or 'label' not in tab:
+                return None, "Each tab must have 'id' and 'label'"
+            unknown = [key for key in tab if key not in HOME_TAB_FIELDS]
+            if unknown:
+                return None, f"Invalid tabs: tab {i} contains unknown field '{unknown[0]}'"
+            for key in ('id', 'label', 'component'):
+                if key in tab and not isinstance(tab[key], str):
+                    return None, f"Invalid tabs: tab {i} field '{key}' must be a string"
+            if 'visible' in tab and not isinstance(tab['visible'], bool):
+                return None, f"Invalid tabs: tab {i} field 'visible' must be true or false"
+            if 'order' in tab:
+                order = tab['order']
+                # bool is an int subclass; NaN/Infinity are not valid JSON numbers
+                if (isinstance(order, bool) or not isinstance(order, (int, float))
+                        or (isinstance(order, float) and not math.isfinite(order))):
+                    return None, f"Invalid tabs: tab {i} field 'order' must be a number"
+        return tabs, None
+    
+    def _insert_example_tabs(self):
+        """Replace the dialog's content with an example tabs configuration."""
+        example = [
+            {"id": "services", "label": "Services", "visible": True, "order": 1},
+            {"id": "promotions", "label": "Promotions", "visible": True, "order": 2},
+            {"id": "profile", "label": "Profile", "visible": True, "order": 3}
+        ]
+        self._tabs_text.delete('1.0', tk.END)
+        self._tabs_text.insert('1.0', json.dumps(example, indent=2))
     
     def load_tenant(self, tenant: Dict):
         """Load tenant data into fields."""
@@ -161,24 +253,24 @@ class TenantDetailFrame(ttk.Frame):
             self.home_tabs_button.config(state='normal')
         else:
             self.home_tabs_button.config(state='disabled')
+        
+        # Loading is not a user edit
+        self._cancel_pending_change()
     
     def get_tenant_data(self) -> Dict:
         """Get current field values as tenant dict."""
-        data = {
+        home_variant = self.home_variant_var.get()
+        return {
             'id': self.tenant_id,
             'companyInitial': self.company_initial_var.get().strip(),
             'appName': self.app_name_var.get().strip(),
             'packageName': self.package_name_var.get().strip(),
             'logoPath': self.logo_path_var.get().strip(),
-            'homeVariant': self.home_variant_var.get(),
-            'enabledFeatures': []  # Will be set separately from plugin matrix
+            'homeVariant': home_variant,
+            'enabledFeatures': [],  # Will be set separately from plugin matrix
+            # Add homeTabs if variant is member
+            **({'homeTabs': self._home_tabs} if home_variant == 'member' else {})
         }
-        
-        # Add homeTabs if variant is member
-        if data['homeVariant'] == 'member':
-            data['homeTabs'] = getattr(self, '_home_tabs', [])
-        
-        return data
     
     def clear(self):
         """Clear all fields."""
@@ -190,68 +282,129 @@ class TenantDetailFrame(ttk.Frame):
         self.home_variant_var.set("member")
         self._home_tabs = []
         self.home_tabs_button.config(state='disabled')
+        self._cancel_pending_change()
 
 
 class PluginMatrixFrame(ttk.LabelFrame):
-    """Frame with checkboxes for each plugin."""
+    """
+    Frame with checkboxes for each plugin.
+    
+    Only the visible rows have widgets: a small pool of checkbox/label pairs is
+    repositioned and rebound to the plugins in view as the canvas scrolls.
+    """
+    
+    POOL_SIZE = 20
+    ROW_PADDING = 4  # Vertical space per row (pady=2 above and below)
+    DESC_PADDING = 10  # Gap between the checkbox and its description
     
     def __init__(self, parent, plugins: Dict, on_change: Optional[Callable] = None):
         super().__init__(parent, text="Plugins", padding="10")
         self.plugins = plugins
         self.on_change = on_change
         self.checkboxes: Dict[str, tk.BooleanVar] = {}
+        self._pool: List[Tuple[ttk.Checkbutton, ttk.Label, int, int]] = []
+        self._pool_index: List[Optional[int]] = []
         
         self._create_widgets()
     
     def _create_widgets(self):
-        """Create checkboxes for each plugin."""
-        # Create a scrollable frame
-        canvas = tk.Canvas(self, height=150)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        """Create the scrollable canvas and the recycled checkbox pool."""
+        self._canvas = canvas = tk.Canvas(self, height=150)
+        self._scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
+        canvas.configure(yscrollcommand=self._on_yscroll)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Variables and row texts for every plugin (cheap); widgets only for the visible window
+        self._items = sorted(self.plugins.items())
+        self._vars = [tk.BooleanVar() for _ in self._items]
+        self.checkboxes = dict(zip((plugin_id for plugin_id, _ in self._items), self._vars))
+        self._rows = [
+            (f"{info.get('label', plugin_id)} ({plugin_id})",
+             f"  └ {info['description']}" if info.get('description') else '')
+            for plugin_id, info in self._items
+        ]
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Font-based defaults; replaced by real widget sizes once the first slot exists
+        self._checkbox_font = tkfont.Font(root=self, font=ttk.Style(self).lookup('TCheckbutton', 'font') or 'TkDefaultFont')
+        self._row_height = self._checkbox_font.metrics('linespace') + self.ROW_PADDING
+        self._desc_x = 0
         
-        # Create checkboxes
-        row = 0
-        for plugin_id in sorted(self.plugins.keys()):
-            plugin_info = self.plugins[plugin_id]
-            label_text = plugin_info.get('label', plugin_id)
-            description = plugin_info.get('description', '')
-            
-            var = tk.BooleanVar()
-            self.checkboxes[plugin_id] = var
-            
-            checkbox = ttk.Checkbutton(
-                scrollable_frame,
-                text=f"{label_text} ({plugin_id})",
-                variable=var,
-                command=self._on_checkbox_change
-            )
-            checkbox.grid(row=row, column=0, sticky="w", pady=2)
-            
-            if description:
-                desc_label = ttk.Label(
-                    scrollable_frame,
-                    text=f"  └ {description}",
-                    foreground="gray",
-                    font=("TkDefaultFont", 8)
-                )
-                desc_label.grid(row=row, column=1, sticky="w", padx=(10, 0), pady=2)
-            
-            row += 1
+        for _ in range(min(self.POOL_SIZE, len(self._items))):
+            self._add_pool_slot()
+        
+        canvas.configure(scrollregion=(0, 0, 0, len(self._items) * self._row_height),
+                         yscrollincrement=self._row_height)
+        canvas.bind("<Configure>", self._on_canvas_configure)
         
         canvas.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
         
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
+        
+        self._recycle()
+    
+    def _add_pool_slot(self):
+        """Create one reusable checkbox/description pair on the canvas."""
+        checkbox = ttk.Checkbutton(self._canvas, command=self._on_checkbox_change)
+        desc_label = ttk.Label(self._canvas, foreground="gray", font=("TkDefaultFont", 8))
+        if not self._pool:
+            self._measure_rows(checkbox, desc_label)
+        checkbox_item = self._canvas.create_window(0, -self._row_height, window=checkbox, anchor="w")
+        desc_item = self._canvas.create_window(self._desc_x, -self._row_height, window=desc_label, anchor="w")
+        self._pool.append((checkbox, desc_label, checkbox_item, desc_item))
+        self._pool_index.append(None)
+    
+    def _measure_rows(self, checkbox: ttk.Checkbutton, desc_label: ttk.Label):
+        """
+        Derive row height and description offset from the actual widget sizes,
+        so fonts, tk scaling and the theme's indicator size are all respected.
+        """
+        text, description = self._rows[0]
+        checkbox.configure(text=text)
+        desc_label.configure(text=description or ' ')
+        checkbox.update_idletasks()
+        
+        self._row_height = max(checkbox.winfo_reqheight(), desc_label.winfo_reqheight()) + self.ROW_PADDING
+        # Checkbox width beyond its text is the indicator plus theme padding
+        indicator_width = max(0, checkbox.winfo_reqwidth() - self._checkbox_font.measure(text))
+        widest_text = max(self._checkbox_font.measure(label_text) for label_text, _ in self._rows)
+        self._desc_x = widest_text + indicator_width + self.DESC_PADDING
+    
+    def _on_canvas_configure(self, event):
+        """Grow the pool if the canvas became taller than the rows it can show."""
+        needed = min(len(self._items), event.height // self._row_height + 2)
+        while len(self._pool) < needed:
+            self._add_pool_slot()
+        self._recycle()
+    
+    def _on_yscroll(self, first, last):
+        """Keep the scrollbar in sync and rebind the pool to the rows now in view."""
+        self._scrollbar.set(first, last)
+        self._recycle()
+    
+    def _recycle(self):
+        """Point each pooled widget pair at the plugin row it should display."""
+        top = max(0, int(self._canvas.canvasy(0)) // self._row_height)
+        for slot, (checkbox, desc_label, checkbox_item, desc_item) in enumerate(self._pool):
+            index = top + slot
+            if index >= len(self._items):
+                index = None
+            if self._pool_index[slot] == index:
+                continue
+            self._pool_index[slot] = index
+            
+            if index is None:
+                # Park unused slots above the scrollregion, where they are never visible
+                self._canvas.coords(checkbox_item, 0, -self._row_height)
+                self._canvas.coords(desc_item, self._desc_x, -self._row_height)
+                continue
+            
+            text, description = self._rows[index]
+            checkbox.configure(text=text, variable=self._vars[index])
+            desc_label.configure(text=description)
+            y = index * self._row_height + self._row_height // 2
+            self._canvas.coords(checkbox_item, 0, y)
+            self._canvas.coords(desc_item, self._desc_x, y)
     
     def _on_checkbox_change(self):
         """Callback when checkbox is toggled."""